@@ -10,10 +10,138 @@ This app allows users to upload images and validate them based on:
 import streamlit as st
 import cv2
 import numpy as np
-from PIL import Image
 import json
 
-from image_validation import validate_image, detect_faces, is_blurry
+from image_validation import validate_image_array
+
+
+@st.cache_data(show_spinner=False)
+def run_validation(
+    file_bytes: bytes,
+    _img_cv: np.ndarray,
+    min_width: int,
+    min_height: int,
+    blur_threshold: float,
+    require_single_face: bool
+) -> dict:
+    """
+    Validate an uploaded image.
+    
+    Results are cached on the file bytes and validation settings, so
+    Streamlit reruns with an unchanged upload skip the whole pipeline.
+    The decoded image is passed as _img_cv; the leading underscore keeps
+    it out of the cache key so the array is never hashed.
+    """
+    return validate_image_array(
+        _img_cv,
+        min_width=min_width,
+        min_height=min_height,
+        blur_threshold=blur_threshold,
+        require_single_face=require_single_face,
+        # Always compute the blur score so every metric can be displayed
+        fast_fail=False
+    )
+
+
+def render_results(
+    file_bytes: bytes,
+    img_cv: np.ndarray,
+    min_width: int,
+    min_height: int,
+    blur_threshold: float,
+    require_single_face: bool
+):
+    """
+    Render the validation results panel.
+    
+    Changing a sidebar setting reruns the whole script, but an unchanged
+    upload and settings hit the cached run_validation result.
+    """
+    st.subheader("✅ Validation Results")
+    
+    # Run validation (cached on the uploaded bytes and settings)
+    with st.spinner("Validating image..."):
+        result = run_validation(
+            file_bytes,
+            img_cv,
+            min_width=min_width,
+            min_height=min_height,
+            blur_threshold=blur_threshold,
+            require_single_face=require_single_face
+        )
+    
+    # Display validation status
+    if result['valid']:
+        st.success("✅ Image Validation PASSED", icon="✅")
+    else:
+        st.error("❌ Image Validation FAILED", icon="❌")
+    
+    # Display metrics
+    metric_col1, metric_col2, metric_col3 = st.columns(3)
+    
+    with metric_col1:
+        st.metric(
+            "Faces Detected",
+            result['num_faces'],
+            delta="✓" if result['num_faces'] > 0 else "✗"
+        )
+    
+    with metric_col2:
+        blur_status = "Clear" if result['blur_score'] >= blur_threshold else "Blurry"
+        st.metric(
+            "Blur Score",
+            f"{result['blur_score']:.1f}",
+            delta=blur_status
+        )
+    
+    with metric_col3:
+        st.metric(
+            "Resolution",
+            f"{result['width']}×{result['height']}"
+        )
+    
+    # Display validation reasons if failed
+    if not result['valid']:
+        st.markdown("### ⚠️ Validation Issues:")
+        for i, reason in enumerate(result['reasons'], 1):
+            st.warning(f"{i}. {reason}")
+    
+    # Show detailed results in expandable section
+    with st.expander("📊 Detailed Analysis"):
+        # Face detection details (reuses the boxes from validation)
+        st.markdown("#### Face Detection")
+        faces = result['faces']
+        if faces:
+            st.success(f"✓ Found {len(faces)} face(s)")
+            for i, (x, y, w, h) in enumerate(faces, 1):
+                st.text(f"  Face {i}: Position ({x}, {y}), Size {w}×{h}")
+            
+            # Draw rectangles on image
+            img_with_faces = img_cv.copy()
+            for (x, y, w, h) in faces:
+                cv2.rectangle(img_with_faces, (x, y), (x+w, y+h), (0, 255, 0), 2)
+            st.image(img_with_faces, caption="Detected Faces", channels="BGR",
+                     use_container_width=True)
+        else:
+            st.error("✗ No faces detected")
+    
+        st.markdown("---")
+    
+        # Blur detection details (reuses the score from validation)
+        st.markdown("#### Blur Analysis")
+        blur_score = result['blur_score']
+        if blur_score < blur_threshold:
+            st.error(f"✗ Image is BLURRY (score: {blur_score:.2f})")
+        else:
+            st.success(f"✓ Image is CLEAR (score: {blur_score:.2f})")
+    
+        st.caption(f"Threshold: {blur_threshold} (lower scores indicate more blur)")
+    
+        st.markdown("---")
+    
+        # Full JSON result
+        st.markdown("#### JSON Response")
+        st.json(result)
 
 
 def main():
@@ -85,6 +213,14 @@ def main():
     )
     
     if uploaded_file is not None:
+        # Decode the upload once, straight to a BGR array (grayscale,
+        # palette and RGBA files are converted to 3-channel BGR)
+        file_bytes = uploaded_file.getvalue()
+        img_cv = cv2.imdecode(np.frombuffer(file_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if img_cv is None:
+            st.error("❌ Unable to read the uploaded image file", icon="❌")
+            return
+        
         # Create two columns
         col1, col2 = st.columns([1, 1])
         
@@ -92,115 +228,17 @@ def main():
             st.subheader("📸 Uploaded Image")
             
             # Display the uploaded image
-            image = Image.open(uploaded_file)
-            st.image(image, use_container_width=True)
-            
-            # Convert PIL Image to OpenCV format
-            img_array = np.array(image)
-            # Convert RGB to BGR for OpenCV
-            if len(img_array.shape) == 3 and img_array.shape[2] == 3:
-                img_cv = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            else:
-                img_cv = img_array
+            st.image(img_cv, channels="BGR", use_container_width=True)
         
         with col2:
-            st.subheader("✅ Validation Results")
-            
-            # Create temp directory if it doesn't exist
-            import os
-            os.makedirs("temp", exist_ok=True)
-            
-            # Save uploaded file temporarily for validation
-            temp_path = os.path.join("temp", f"temp_{uploaded_file.name}")
-            with open(temp_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # Run validation
-            with st.spinner("Validating image..."):
-                result = validate_image(
-                    temp_path,
-                    min_width=min_width,
-                    min_height=min_height,
-                    blur_threshold=blur_threshold,
-                    require_single_face=require_single_face
-                )
-            
-            # Display validation status
-            if result['valid']:
-                st.success("✅ Image Validation PASSED", icon="✅")
-            else:
-                st.error("❌ Image Validation FAILED", icon="❌")
-            
-            # Display metrics
-            metric_col1, metric_col2, metric_col3 = st.columns(3)
-            
-            with metric_col1:
-                st.metric(
-                    "Faces Detected",
-                    result['num_faces'],
-                    delta="✓" if result['num_faces'] > 0 else "✗"
-                )
-            
-            with metric_col2:
-                blur_status = "Clear" if result['blur_score'] >= blur_threshold else "Blurry"
-                st.metric(
-                    "Blur Score",
-                    f"{result['blur_score']:.1f}",
-                    delta=blur_status
-                )
-            
-            with metric_col3:
-                st.metric(
-                    "Resolution",
-                    f"{result['width']}×{result['height']}"
-                )
-            
-            # Display validation reasons if failed
-            if not result['valid']:
-                st.markdown("### ⚠️ Validation Issues:")
-                for i, reason in enumerate(result['reasons'], 1):
-                    st.warning(f"{i}. {reason}")
-            
-            # Show detailed results in expandable section
-            with st.expander("📊 Detailed Analysis"):
-                # Face detection details
-                st.markdown("#### Face Detection")
-                faces = detect_faces(img_cv)
-                if faces:
-                    st.success(f"✓ Found {len(faces)} face(s)")
-                    for i, (x, y, w, h) in enumerate(faces, 1):
-                        st.text(f"  Face {i}: Position ({x}, {y}), Size {w}×{h}")
-                    
-                    # Draw rectangles on image
-                    img_with_faces = img_array.copy()
-                    for (x, y, w, h) in faces:
-                        cv2.rectangle(img_with_faces, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                    st.image(img_with_faces, caption="Detected Faces", use_container_width=True)
-                else:
-                    st.error("✗ No faces detected")
-                
-                st.markdown("---")
-                
-                # Blur detection details
-                st.markdown("#### Blur Analysis")
-                blurry, blur_score = is_blurry(img_cv, threshold=blur_threshold)
-                if blurry:
-                    st.error(f"✗ Image is BLURRY (score: {blur_score:.2f})")
-                else:
-                    st.success(f"✓ Image is CLEAR (score: {blur_score:.2f})")
-                
-                st.caption(f"Threshold: {blur_threshold} (lower scores indicate more blur)")
-                
-                st.markdown("---")
-                
-                # Full JSON result
-                st.markdown("#### JSON Response")
-                st.json(result)
-            
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            render_results(
+                file_bytes,
+                img_cv,
+                min_width=min_width,
+                min_height=min_height,
+                blur_threshold=blur_threshold,
+                require_single_face=require_single_face
+            )
     
     else:
         # Show placeholder when no image is uploaded
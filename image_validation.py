@@ -2,62 +2,437 @@
 Image validation module for checking face presence and image clarity.
 
 This module provides functions to:
-1. Detect human faces in images using OpenCV's Haar cascade classifier
+1. Detect human faces in images using OpenCV's cascade classifiers (LBP or Haar)
 2. Assess image blur using Laplacian variance
 3. Validate images based on multiple criteria (resolution, face presence, clarity)
 """
 
 import os
-from typing import List, Tuple, Dict
+import threading
+from typing import List, Optional, Tuple, Dict
 
 import cv2
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; OpenCV is used for the blur check
+    NUMBA_AVAILABLE = False
 
-def detect_faces(image: np.ndarray) -> List[Tuple[int, int, int, int]]:
+
+# Candidate cascade files for frontal face detection, in order of preference.
+# The LBP cascade uses integer comparisons instead of Haar rectangle sums and
+# is considerably faster at comparable accuracy for frontal faces. The
+# opencv-python wheels only bundle Haar cascades, so the LBP cascade
+# (BSD-licensed, from OpenCV's data/lbpcascades) is shipped next to this
+# module; the bundled Haar cascade is kept as a fallback.
+CASCADE_CANDIDATES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 'lbpcascade_frontalface_improved.xml'),
+    os.path.join(cv2.data.haarcascades, 'haarcascade_frontalface_default.xml'),
+]
+
+
+def _load_face_cascade() -> Tuple[str, cv2.CascadeClassifier]:
+    """
+    Load the first available face cascade from CASCADE_CANDIDATES.
+    
+    Returns:
+        A tuple of (cascade_path, classifier).
+    
+    Raises:
+        RuntimeError: If none of the candidate cascade files can be loaded.
+    """
+    for path in CASCADE_CANDIDATES:
+        if os.path.exists(path):
+            cascade = cv2.CascadeClassifier(path)
+            if not cascade.empty():
+                return path, cascade
+    raise RuntimeError(
+        f"Unable to load a face cascade from: {', '.join(CASCADE_CANDIDATES)}"
+    )
+
+
+# Load the face cascade classifier once at import.
+# Parsing the cascade XML is far more expensive than a single detection pass
+# on small images, so the classifier is shared across all calls.
+CASCADE_PATH, FACE_CASCADE = _load_face_cascade()
+
+# Largest image side (in pixels) used for face detection. Detection cost
+# grows quickly with image size, so larger images are downscaled first and
+# the resulting boxes are mapped back to the original coordinates. Callers
+# that need faces smaller than the cascade window at this scale pass a
+# min_face_size, which limits the downscale (see _detection_scale).
+MAX_DETECTION_DIMENSION = 640
+
+# Smallest face (width, height) the cascade can find, in detection pixels:
+# 45x45 for the LBP cascade, whose boxes are tight around eyes, nose and
+# mouth (about 0.6x the size of Haar boxes, so roughly a 75x75 Haar box),
+# or 24x24 for the Haar fallback
+CASCADE_WINDOW_SIZE = tuple(FACE_CASCADE.getOriginalWindowSize())
+
+# Detection parameters, tuned for good balance between detection and
+# false positives. Shared by the CPU and CUDA detectors.
+SCALE_FACTOR = 1.1        # Image pyramid scale reduction
+MIN_NEIGHBORS = 5         # Minimum neighbors for a detection to be kept
+
+# Note: equalizing the histogram before detection was measured to make
+# detection 1.04-2.5x slower on the sample images (boosted contrast lets
+# more windows past the early cascade stages) without changing which faces
+# were found, and CASCADE_DO_CANNY_PRUNING made no measurable difference,
+# so neither is used.
+
+# Images whose largest side exceeds this are halved before the blur check
+# when downsampling is requested
+BLUR_DOWNSAMPLE_MIN_DIMENSION = 512
+
+# Grayscale conversion for each supported channel order. Accepting RGB
+# directly lets callers holding RGB data (e.g. from PIL) skip an RGB to BGR
+# copy of the full image.
+GRAY_CONVERSIONS = {
+    'BGR': cv2.COLOR_BGR2GRAY,
+    'RGB': cv2.COLOR_RGB2GRAY,
+}
+
+
+def _check_channels(channels: str) -> None:
+    """
+    Validate a channels argument.
+    
+    Raises:
+        ValueError: If channels is not one of the GRAY_CONVERSIONS keys.
+    """
+    if channels not in GRAY_CONVERSIONS:
+        raise ValueError(
+            f"channels must be one of {', '.join(map(repr, GRAY_CONVERSIONS))}, "
+            f"got {channels!r}"
+        )
+
+
+def _to_gray(image: np.ndarray, channels: str) -> np.ndarray:
+    """Convert a 3-channel image in the given channel order to grayscale."""
+    return cv2.cvtColor(image, GRAY_CONVERSIONS[channels])
+
+
+def _load_cuda_face_cascade():
+    """
+    Create a CUDA cascade classifier if a CUDA-enabled device is present.
+    
+    Returns:
+        A configured cv2.cuda_CascadeClassifier, or None if OpenCV was built
+        without CUDA support, no device is available, or the cascade cannot
+        be loaded on the GPU.
+    """
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            return None
+        cascade = cv2.cuda_CascadeClassifier.create(CASCADE_PATH)
+    except (AttributeError, cv2.error):
+        return None
+    
+    cascade.setScaleFactor(SCALE_FACTOR)
+    cascade.setMinNeighbors(MIN_NEIGHBORS)
+    return cascade
+
+
+# GPU face detector, or None to use the CPU cascade
+CUDA_FACE_CASCADE = _load_cuda_face_cascade()
+
+# The CUDA classifier keeps the minimum face size as state, so setting it
+# and detecting must not interleave between threads (Streamlit runs one
+# script thread per session)
+_CUDA_CASCADE_LOCK = threading.Lock()
+
+
+def _opencl_enabled() -> bool:
+    """
+    Check whether images should be wrapped in cv2.UMat.
+    
+    OpenCV's transparent API runs cascade detection and filters on any
+    OpenCL device (including integrated GPUs) when images are wrapped in
+    cv2.UMat. This follows the process-wide cv2.ocl.useOpenCL() setting,
+    which is left to the caller and read on every call, so enabling or
+    disabling OpenCL after import takes effect.
+    """
+    return cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+
+
+def _detection_scale(
+    shape: Tuple[int, ...],
+    max_dimension: int,
+    min_face_size: Optional[Tuple[int, int]]
+) -> Tuple[float, Tuple[int, int]]:
+    """
+    Choose the detection scale and the minimum face size at that scale.
+    
+    The image is shrunk so its largest side fits max_dimension. Without a
+    min_face_size, the smallest face found is one that fills the cascade
+    window at that scale. With one, the image is never shrunk so far that a
+    face of min_face_size would fall below CASCADE_WINDOW_SIZE and become
+    undetectable.
+    
+    Returns:
+        A tuple of (scale, min_size), where scale <= 1.0 and min_size is
+        the minimum face size in detection pixels.
+    """
+    scale = min(1.0, max_dimension / max(shape[:2]))
+    if min_face_size is None:
+        return scale, CASCADE_WINDOW_SIZE
+    floor = max(CASCADE_WINDOW_SIZE[0] / min_face_size[0],
+                CASCADE_WINDOW_SIZE[1] / min_face_size[1])
+    scale = min(1.0, max(scale, floor))
+    min_size = (max(1, round(min_face_size[0] * scale)),
+                max(1, round(min_face_size[1] * scale)))
+    return scale, min_size
+
+
+def _detect_faces_cpu(
+    gray: np.ndarray,
+    scale: float,
+    min_size: Tuple[int, int]
+) -> np.ndarray:
+    """Run the CPU (or OpenCL) cascade on a grayscale image resized by scale."""
+    if _opencl_enabled():
+        gray = cv2.UMat(gray)
+    
+    # Downscale large images to reduce the number of pyramid levels and
+    # windows the cascade has to evaluate
+    if scale < 1.0:
+        gray = cv2.resize(gray, None, fx=scale, fy=scale,
+                          interpolation=cv2.INTER_AREA)
+    
+    return FACE_CASCADE.detectMultiScale(
+        gray,
+        scaleFactor=SCALE_FACTOR,
+        minNeighbors=MIN_NEIGHBORS,
+        minSize=min_size,
+        flags=cv2.CASCADE_SCALE_IMAGE
+    )
+
+
+def _detect_faces_cuda(
+    image: np.ndarray,
+    scale: float,
+    min_size: Tuple[int, int],
+    gray: Optional[np.ndarray] = None,
+    channels: str = 'BGR'
+) -> List:
+    """Run the CUDA cascade on an image resized by scale."""
+    gpu_gray = cv2.cuda_GpuMat()
+    if gray is not None:
+        gpu_gray.upload(gray)
+    else:
+        gpu_gray.upload(image)
+        gpu_gray = cv2.cuda.cvtColor(gpu_gray, GRAY_CONVERSIONS[channels])
+    
+    if scale < 1.0:
+        height, width = image.shape[:2]
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        gpu_gray = cv2.cuda.resize(gpu_gray, size,
+                                   interpolation=cv2.INTER_AREA)
+    
+    with _CUDA_CASCADE_LOCK:
+        CUDA_FACE_CASCADE.setMinObjectSize(min_size)
+        objbuf = CUDA_FACE_CASCADE.detectMultiScale(gpu_gray)
+        faces = CUDA_FACE_CASCADE.convert(objbuf)
+    return faces if faces is not None else []
+
+
+def detect_faces(
+    image: np.ndarray,
+    max_dimension: int = MAX_DETECTION_DIMENSION,
+    gray: Optional[np.ndarray] = None,
+    channels: str = 'BGR',
+    min_face_size: Optional[Tuple[int, int]] = None
+) -> np.ndarray:
     """
-    Detect human faces in an image using Haar cascade classifier.
+    Detect human faces in an image using a cascade classifier.
+    
+    The LBP frontal face cascade is used when available, falling back to
+    the Haar cascade otherwise (see CASCADE_CANDIDATES). Detection runs on
+    the GPU when OpenCV has CUDA support and a device is present, or through
+    OpenCL (cv2.UMat) when an OpenCL device is available.
+    
+    Images whose largest side exceeds max_dimension are downscaled to it
+    before detection; returned boxes are always in original image
+    coordinates. By default the smallest face found is one that fills the
+    cascade window (CASCADE_WINDOW_SIZE) after the downscale, so it grows
+    with the image: 45x45 for images up to 640 pixels, about 108x108 for a
+    1536x1024 image with the LBP cascade. Pass min_face_size to find
+    smaller faces in large images; the downscale is then limited so a face
+    of that size still fills the window, at the cost of speed.
+    
+    Face sizes are measured in the cascade's own box size. The LBP
+    cascade's boxes are tight around eyes, nose and mouth, about 0.6x the
+    size of the Haar cascade's boxes, and no face smaller than the cascade
+    window is found at any min_face_size.
     
     Args:
-        image: BGR image loaded with OpenCV (numpy array).
+        image: BGR image loaded with OpenCV (numpy array), or RGB image
+               when channels is 'RGB'.
+        max_dimension: Images whose largest side exceeds this are downscaled
+                      to it before detection, unless min_face_size needs a
+                      larger scale. Default is 640.
+        gray: Optional precomputed grayscale version of image. When given,
+              the color to grayscale conversion is skipped.
+        channels: Channel order of image, 'BGR' or 'RGB'. Default is 'BGR'.
+        min_face_size: Smallest face (width, height) to detect, in original
+                      image pixels, or None to detect faces down to the
+                      cascade window at max_dimension. Default is None.
     
     Returns:
-        List of bounding boxes for detected faces, where each box is 
-        represented as a tuple (x, y, w, h):
+        An int32 array of shape (N, 4) with one bounding box per detected
+        face, where each row is (x, y, w, h):
         - x: left coordinate
         - y: top coordinate
         - w: width
         - h: height
-        Returns an empty list if no faces are detected.
+        Returns an array of shape (0, 4) if no faces are detected.
+    
+    Raises:
+        ValueError: If channels is not 'BGR' or 'RGB'.
     
     Example:
         >>> img = cv2.imread('photo.jpg')
         >>> faces = detect_faces(img)
         >>> print(f"Found {len(faces)} face(s)")
+        >>> for x, y, w, h in faces:
+        ...     cv2.rectangle(img, (x, y), (x + w, y + h), (0, 255, 0), 2)
     """
-    # Convert to grayscale for face detection
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    _check_channels(channels)
     
-    # Load the Haar cascade classifier for frontal face detection
-    # This uses OpenCV's built-in cascade file
-    cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-    face_cascade = cv2.CascadeClassifier(cascade_path)
+    scale, min_size = _detection_scale(image.shape, max_dimension,
+                                       min_face_size)
     
-    # Detect faces in the image
-    # Parameters tuned for good balance between detection and false positives
-    faces = face_cascade.detectMultiScale(
-        gray,
-        scaleFactor=1.1,      # Image pyramid scale reduction
-        minNeighbors=5,       # Minimum neighbors for a detection to be kept
-        minSize=(30, 30),     # Minimum face size
-        flags=cv2.CASCADE_SCALE_IMAGE
-    )
+    if CUDA_FACE_CASCADE is not None:
+        faces = _detect_faces_cuda(image, scale, min_size, gray, channels)
+    else:
+        if gray is None:
+            gray = _to_gray(image, channels)
+        faces = _detect_faces_cpu(gray, scale, min_size)
+    
+    # detectMultiScale returns an empty tuple when nothing is found
+    faces = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
     
-    # Convert numpy array to list of tuples
-    return [(int(x), int(y), int(w), int(h)) for x, y, w, h in faces]
+    # Map boxes back to original image coordinates
+    if scale < 1.0:
+        faces = (faces / scale).astype(np.int32)
+    return faces
 
 
-def is_blurry(image: np.ndarray, threshold: float = 200.0) -> Tuple[bool, float]:
+if NUMBA_AVAILABLE:
+    # The kernels below are deliberately shape-generic. Kernels specialized
+    # per (height, width), with the sizes baked in as compile-time constants,
+    # measured within +/-5% of these on 1536x1024 and 3994x2662 inputs (the
+    # loops are bound by memory and arithmetic, not by loop control), while
+    # each new shape cost ~5 s of compilation that cannot be cached to disk.
+
+    @njit(inline='always')
+    def _reflect101(i: int, n: int) -> int:
+        """Mirror an out-of-range index like cv2.BORDER_REFLECT_101."""
+        if n == 1:
+            return 0
+        if i < 0:
+            return -i
+        if i >= n:
+            return 2 * n - 2 - i
+        return i
+
+    # Fixed-point (Q15) luma weights for blue, green and red, with the same
+    # rounding as cv2.cvtColor(..., COLOR_BGR2GRAY) on 8-bit images, so the
+    # fused kernel scores exactly the grayscale image the other paths use
+    _LUMA_SHIFT = 15
+    _LUMA_B, _LUMA_G, _LUMA_R = 3735, 19235, 9798
+
+    @njit(inline='always')
+    def _luma_row(color_row, out, w0: int, w2: int) -> None:
+        """Luma of one interleaved 3-channel row with outer weights w0, w2."""
+        for x in range(out.shape[0]):
+            out[x] = (np.int32(color_row[3 * x]) * w0
+                      + np.int32(color_row[3 * x + 1]) * _LUMA_G
+                      + np.int32(color_row[3 * x + 2]) * w2
+                      + (1 << (_LUMA_SHIFT - 1))) >> _LUMA_SHIFT
+
+    @njit(inline='always')
+    def _row_laplacian_sums(up, mid, down) -> Tuple[int, int]:
+        """Sum and sum of squares of the 3x3 Laplacian along one row."""
+        width = mid.shape[0]
+        s = 0
+        s2 = 0
+        for x in range(1, width - 1):
+            lap = (np.int64(up[x]) + down[x] + mid[x - 1] + mid[x + 1]
+                   - 4 * np.int64(mid[x]))
+            s += lap
+            s2 += lap * lap
+        # Border columns: with BORDER_REFLECT_101 both horizontal neighbors
+        # of an edge pixel are the same inner pixel
+        for x in range(0, width, max(width - 1, 1)):
+            xn = _reflect101(x + 1 if x == 0 else x - 1, width)
+            lap = (np.int64(up[x]) + down[x] + 2 * np.int64(mid[xn])
+                   - 4 * np.int64(mid[x]))
+            s += lap
+            s2 += lap * lap
+        return s, s2
+
+    # The kernels run serially: the app calls them from one Streamlit
+    # script thread per session, and numba's parallel threading layers are
+    # either not safe for concurrent callers (workqueue) or keep the
+    # process from exiting when first used off the main thread (TBB).
+
+    @njit(fastmath=True, cache=True)
+    def _laplacian_variance_gray(gray) -> float:
+        """Variance of the 3x3 Laplacian of a grayscale image in one pass."""
+        height, width = gray.shape
+        s = 0
+        s2 = 0
+        for y in range(height):
+            rs, rs2 = _row_laplacian_sums(gray[_reflect101(y - 1, height)],
+                                          gray[y],
+                                          gray[_reflect101(y + 1, height)])
+            s += rs
+            s2 += rs2
+        n = height * width
+        mean = s / n
+        return s2 / n - mean * mean
+
+    @njit(fastmath=True, cache=True)
+    def _laplacian_variance_color(image, w0: int, w2: int) -> float:
+        """
+        Variance of the 3x3 Laplacian of a color image's luma in one pass.
+        
+        w0 and w2 are the luma weights of the first and last channel, which
+        selects BGR or RGB order. Luma is computed into a rolling three-row
+        buffer, so neither a grayscale nor a Laplacian image is ever
+        materialized.
+        """
+        height, width = image.shape[:2]
+        rows = image.reshape(height, width * 3)
+        buf = np.empty((3, width), np.int32)
+        _luma_row(rows[_reflect101(-1, height)], buf[0], w0, w2)
+        _luma_row(rows[0], buf[1], w0, w2)
+        s = 0
+        s2 = 0
+        for y in range(height):
+            up = buf[y % 3]
+            mid = buf[(y + 1) % 3]
+            down = buf[(y + 2) % 3]
+            _luma_row(rows[_reflect101(y + 1, height)], down, w0, w2)
+            rs, rs2 = _row_laplacian_sums(up, mid, down)
+            s += rs
+            s2 += rs2
+        n = height * width
+        mean = s / n
+        return s2 / n - mean * mean
+
+
+def is_blurry(
+    image: np.ndarray,
+    threshold: float = 200.0,
+    gray: Optional[np.ndarray] = None,
+    downsample: bool = False,
+    channels: str = 'BGR'
+) -> Tuple[bool, float]:
     """
     Determine if an image is blurry using the variance of the Laplacian method.
     
@@ -65,10 +440,25 @@ def is_blurry(image: np.ndarray, threshold: float = 200.0) -> Tuple[bool, float]
     computes its variance. A lower variance indicates less edge content, 
     which typically means the image is blurry.
     
+    With downsample=True, images larger than BLUR_DOWNSAMPLE_MIN_DIMENSION
+    are halved in each dimension before filtering, cutting the work by 4x.
+    The ordering of scores is preserved, but their absolute values shift
+    (usually upward), so thresholds should be calibrated for this mode.
+    
+    When numba is installed, the grayscale conversion, Laplacian and
+    variance are fused into a single JIT-compiled pass over the image.
+    Otherwise OpenCV is used, through OpenCL when a device is available.
+    
     Args:
-        image: BGR image loaded with OpenCV (numpy array).
+        image: BGR image loaded with OpenCV (numpy array), or RGB image
+               when channels is 'RGB'.
         threshold: Focus measure threshold. Values below this threshold 
                   indicate a blurry image. Default is 100.0.
+        gray: Optional precomputed grayscale version of image. When given,
+              the color to grayscale conversion is skipped.
+        downsample: If True, compute the focus measure on a half-resolution
+                   copy of large images. Default is False.
+        channels: Channel order of image, 'BGR' or 'RGB'. Default is 'BGR'.
     
     Returns:
         A tuple containing:
@@ -76,6 +466,9 @@ def is_blurry(image: np.ndarray, threshold: float = 200.0) -> Tuple[bool, float]
                 False otherwise
         - float: The computed focus measure (variance of Laplacian)
     
+    Raises:
+        ValueError: If channels is not 'BGR' or 'RGB'.
+    
     Example:
         >>> img = cv2.imread('photo.jpg')
         >>> blurry, score = is_blurry(img, threshold=100.0)
@@ -85,82 +478,188 @@ def is_blurry(image: np.ndarray, threshold: float = 200.0) -> Tuple[bool, float]
         - Pech-Pacheco et al. "Diatom autofocusing in brightfield microscopy: 
           a comparative study." ICPR 2000.
     """
-    # Convert to grayscale
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    _check_channels(channels)
+    
+    # Fused numba kernel: no grayscale or Laplacian buffers at all
+    if (NUMBA_AVAILABLE and gray is None and not downsample
+            and image.ndim == 3 and image.shape[2] == 3
+            and image.dtype == np.uint8 and image.flags['C_CONTIGUOUS']):
+        if channels == 'RGB':
+            w0, w2 = _LUMA_R, _LUMA_B
+        else:
+            w0, w2 = _LUMA_B, _LUMA_R
+        focus_measure = _laplacian_variance_color(image, w0, w2)
+        return (focus_measure < threshold, float(focus_measure))
+    
+    # Convert to grayscale unless the caller already did
+    if gray is None:
+        gray = _to_gray(image, channels)
+    
+    if downsample and max(gray.shape[:2]) > BLUR_DOWNSAMPLE_MIN_DIMENSION:
+        gray = cv2.resize(gray, None, fx=0.5, fy=0.5,
+                          interpolation=cv2.INTER_AREA)
+    
+    if NUMBA_AVAILABLE and gray.dtype == np.uint8:
+        focus_measure = _laplacian_variance_gray(gray)
+        return (focus_measure < threshold, float(focus_measure))
     
     # Compute the Laplacian of the image and then the variance
-    # The Laplacian highlights regions of rapid intensity change (edges)
-    laplacian = cv2.Laplacian(gray, cv2.CV_64F)
-    focus_measure = laplacian.var()
+    # The Laplacian highlights regions of rapid intensity change (edges).
+    # For 8-bit input the 3x3 Laplacian is exact in float32, which halves
+    # memory traffic compared to float64. The kernel also decomposes into
+    # horizontal and vertical [1, -2, 1] passes, but two filter2D or
+    # sepFilter2D calls plus an add measured ~50% slower on large images
+    # than this single pass, so the 2-D kernel is kept.
+    if _opencl_enabled():
+        gray = cv2.UMat(gray)
+    laplacian = cv2.Laplacian(gray, cv2.CV_32F)
+    
+    # meanStdDev computes mean and standard deviation in a single pass
+    # (it accepts a UMat, so only the result is copied back)
+    _, stddev = cv2.meanStdDev(laplacian)
+    if isinstance(stddev, cv2.UMat):
+        stddev = stddev.get()
+    focus_measure = float(stddev[0, 0]) ** 2
     
     # Return whether the image is blurry and the focus measure
     return (focus_measure < threshold, float(focus_measure))
 
 
-def validate_image(
-    path: str,
+def is_blurry_batch(
+    images: List[np.ndarray],
+    threshold: float = 200.0,
+    channels: str = 'BGR'
+) -> List[Tuple[bool, float]]:
+    """
+    Run the blur check on several images with a single Laplacian call.
+    
+    Each grayscale image gets a one-pixel reflected border (matching
+    cv2.BORDER_REFLECT_101), is zero-padded on the right to a common width,
+    and the results are stacked vertically into one tall image. After a
+    single cv2.Laplacian pass the per-image slices are reduced separately,
+    so every score is identical to what the OpenCV path of is_blurry
+    returns, while the per-call overhead is paid once for the whole batch.
+    
+    Args:
+        images: List of BGR images loaded with OpenCV (numpy arrays), or
+                RGB images when channels is 'RGB'.
+        threshold: Focus measure threshold. Values below this threshold 
+                  indicate a blurry image. Default is 200.0.
+        channels: Channel order of the images, 'BGR' or 'RGB'. Default is 'BGR'.
+    
+    Returns:
+        A list with one (is_blurry, focus_measure) tuple per input image,
+        in input order.
+    
+    Raises:
+        ValueError: If channels is not 'BGR' or 'RGB'.
+    
+    Example:
+        >>> imgs = [cv2.imread(p) for p in ('a.jpg', 'b.jpg')]
+        >>> for blurry, score in is_blurry_batch(imgs, threshold=100.0):
+        ...     print(f"Blur score: {score:.2f}, Blurry: {blurry}")
+    """
+    _check_channels(channels)
+    
+    if not images:
+        return []
+    
+    grays = [_to_gray(image, channels) for image in images]
+    stacked_width = max(gray.shape[1] for gray in grays) + 2
+    
+    # Pad each image by one reflected pixel, then fill out to a common width
+    padded = []
+    for gray in grays:
+        bordered = np.pad(gray, 1, mode='reflect')
+        padded.append(np.pad(
+            bordered, ((0, 0), (0, stacked_width - bordered.shape[1]))
+        ))
+    laplacian = cv2.Laplacian(np.vstack(padded), cv2.CV_32F)
+    
+    results = []
+    top = 0
+    for gray in grays:
+        height, width = gray.shape
+        region = laplacian[top + 1:top + 1 + height, 1:1 + width]
+        _, stddev = cv2.meanStdDev(region)
+        focus_measure = float(stddev[0, 0]) ** 2
+        results.append((focus_measure < threshold, focus_measure))
+        top += height + 2
+    
+    return results
+
+
+def _new_result() -> Dict:
+    """Create a validation result dictionary with default values."""
+    return {
+        'valid': False,
+        'reasons': [],
+        'num_faces': 0,
+        'faces': [],
+        'blur_score': 0.0,
+        'width': 0,
+        'height': 0
+    }
+
+
+def validate_image_array(
+    image: np.ndarray,
     min_width: int = 256,
     min_height: int = 256,
     blur_threshold: float = 200.0,
-    require_single_face: bool = False
+    require_single_face: bool = False,
+    blur_downsample: bool = False,
+    channels: str = 'BGR',
+    fast_fail: bool = True,
+    min_face_size: Optional[Tuple[int, int]] = None,
+    max_dimension: int = MAX_DETECTION_DIMENSION
 ) -> Dict:
     """
-    Validate an image based on multiple criteria.
+    Validate an already-decoded image based on multiple criteria.
     
-    Performs comprehensive validation including:
-    - File existence and readability
+    Performs the same checks as validate_image, minus the file handling:
     - Minimum resolution requirements
     - Face detection (at least one face required)
     - Optional single face requirement
     - Blur detection
     
     Args:
-        path: Path to the image file.
+        image: BGR image (numpy array), e.g. from cv2.imread or cv2.imdecode,
+               or RGB image when channels is 'RGB'.
         min_width: Minimum required image width in pixels. Default is 256.
         min_height: Minimum required image height in pixels. Default is 256.
         blur_threshold: Threshold for blur detection. Images with focus 
                        measure below this are considered blurry. Default is 100.0.
         require_single_face: If True, validation fails unless exactly one 
                             face is detected. Default is False.
+        blur_downsample: If True, compute the blur score on a half-resolution
+                        copy of large images (see is_blurry). Default is False.
+        channels: Channel order of image, 'BGR' or 'RGB'. Default is 'BGR'.
+        fast_fail: If True, skip the blur check once the resolution or face
+                  checks have already failed; blur_score is then None.
+                  Default is True.
+        min_face_size: Smallest face (width, height) to detect, in original
+                      image pixels, or None to detect faces down to the
+                      cascade window at max_dimension (see detect_faces).
+                      Default is None.
+        max_dimension: Largest image side used for face detection, unless
+                      min_face_size needs a larger scale (see detect_faces).
+                      Default is 640.
     
     Returns:
-        A JSON-serializable dictionary containing:
-        - valid (bool): True if all validation checks pass, False otherwise
-        - reasons (List[str]): List of validation failure reasons (empty if valid)
-        - num_faces (int): Number of faces detected (0 if image couldn't be loaded)
-        - blur_score (float): Focus measure score (0.0 if image couldn't be loaded)
-        - width (int): Image width in pixels (0 if image couldn't be loaded)
-        - height (int): Image height in pixels (0 if image couldn't be loaded)
+        A JSON-serializable dictionary with the same keys as validate_image.
+    
+    Raises:
+        ValueError: If channels is not 'BGR' or 'RGB'.
     
     Example:
-        >>> result = validate_image('photo.jpg', blur_threshold=100.0)
-        >>> if result['valid']:
-        ...     print("Image is valid!")
-        ... else:
-        ...     print(f"Validation failed: {', '.join(result['reasons'])}")
-        >>> print(f"Detected {result['num_faces']} face(s)")
-        >>> print(f"Blur score: {result['blur_score']:.2f}")
+        >>> img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        >>> result = validate_image_array(img, blur_threshold=100.0)
+        >>> print(f"Valid: {result['valid']}")
     """
-    # Initialize result dictionary with default values
-    result: Dict = {
-        'valid': False,
-        'reasons': [],
-        'num_faces': 0,
-        'blur_score': 0.0,
-        'width': 0,
-        'height': 0
-    }
-    
-    # Check if file exists
-    if not os.path.exists(path):
-        result['reasons'].append(f"File does not exist: {path}")
-        return result
+    _check_channels(channels)
     
-    # Try to load the image
-    image = cv2.imread(path)
-    if image is None:
-        result['reasons'].append(f"Unable to read image file: {path}")
-        return result
+    result = _new_result()
     
     # Get image dimensions
     height, width = image.shape[:2]
@@ -174,10 +673,15 @@ def validate_image(
             f"required ({min_width}x{min_height})"
         )
     
+    # Convert to grayscale once and share it between face and blur detection
+    gray = _to_gray(image, channels)
+    
     # Detect faces
-    faces = detect_faces(image)
+    faces = detect_faces(image, max_dimension=max_dimension, gray=gray,
+                         min_face_size=min_face_size)
     num_faces = len(faces)
     result['num_faces'] = num_faces
+    result['faces'] = faces.tolist()
     
     # Check face requirements
     if num_faces == 0:
@@ -187,8 +691,15 @@ def validate_image(
             f"Expected exactly 1 face, but found {num_faces} face(s)"
         )
     
+    # The image is already rejected; skip the blur check if allowed
+    if fast_fail and result['reasons']:
+        result['blur_score'] = None
+        return result
+    
     # Check for blur
-    blurry, blur_score = is_blurry(image, threshold=blur_threshold)
+    blurry, blur_score = is_blurry(
+        image, threshold=blur_threshold, gray=gray, downsample=blur_downsample
+    )
     result['blur_score'] = blur_score
     
     if blurry:
@@ -201,3 +712,124 @@ def validate_image(
     result['valid'] = len(result['reasons']) == 0
     
     return result
+
+
+def validate_image(
+    path: str,
+    min_width: int = 256,
+    min_height: int = 256,
+    blur_threshold: float = 200.0,
+    require_single_face: bool = False,
+    blur_downsample: bool = False,
+    fast_fail: bool = True,
+    min_face_size: Optional[Tuple[int, int]] = None,
+    max_dimension: int = MAX_DETECTION_DIMENSION
+) -> Dict:
+    """
+    Validate an image based on multiple criteria.
+    
+    Performs comprehensive validation including:
+    - File existence and readability
+    - Minimum resolution requirements
+    - Face detection (at least one face required)
+    - Optional single face requirement
+    - Blur detection
+    
+    This loads the image from disk and delegates to validate_image_array;
+    callers that already hold a decoded image should call that directly.
+    
+    Args:
+        path: Path to the image file.
+        min_width: Minimum required image width in pixels. Default is 256.
+        min_height: Minimum required image height in pixels. Default is 256.
+        blur_threshold: Threshold for blur detection. Images with focus 
+                       measure below this are considered blurry. Default is 100.0.
+        require_single_face: If True, validation fails unless exactly one 
+                            face is detected. Default is False.
+        blur_downsample: If True, compute the blur score on a half-resolution
+                        copy of large images (see is_blurry). Default is False.
+        fast_fail: If True, skip the blur check once the resolution or face
+                  checks have already failed; blur_score is then None.
+                  Default is True.
+        min_face_size: Smallest face (width, height) to detect, in original
+                      image pixels, or None to detect faces down to the
+                      cascade window at max_dimension (see detect_faces).
+                      Default is None.
+        max_dimension: Largest image side used for face detection, unless
+                      min_face_size needs a larger scale (see detect_faces).
+                      Default is 640.
+    
+    Returns:
+        A JSON-serializable dictionary containing:
+        - valid (bool): True if all validation checks pass, False otherwise
+        - reasons (List[str]): List of validation failure reasons (empty if valid)
+        - num_faces (int): Number of faces detected (0 if image couldn't be loaded)
+        - faces (List[List[int]]): Bounding box [x, y, w, h] of each detected
+          face, as returned by detect_faces (empty if image couldn't be loaded)
+        - blur_score (float or None): Focus measure score (0.0 if image
+          couldn't be loaded, None if skipped by fast_fail)
+        - width (int): Image width in pixels (0 if image couldn't be loaded)
+        - height (int): Image height in pixels (0 if image couldn't be loaded)
+    
+    Example:
+        >>> result = validate_image('photo.jpg', blur_threshold=100.0)
+        >>> if result['valid']:
+        ...     print("Image is valid!")
+        ... else:
+        ...     print(f"Validation failed: {', '.join(result['reasons'])}")
+        >>> print(f"Detected {result['num_faces']} face(s)")
+        >>> if result['blur_score'] is not None:
+        ...     print(f"Blur score: {result['blur_score']:.2f}")
+    """
+    # Check if file exists
+    if not os.path.exists(path):
+        result = _new_result()
+        result['reasons'].append(f"File does not exist: {path}")
+        return result
+    
+    # Try to load the image
+    image = cv2.imread(path)
+    if image is None:
+        result = _new_result()
+        result['reasons'].append(f"Unable to read image file: {path}")
+        return result
+    
+    return validate_image_array(
+        image,
+        min_width=min_width,
+        min_height=min_height,
+        blur_threshold=blur_threshold,
+        require_single_face=require_single_face,
+        blur_downsample=blur_downsample,
+        fast_fail=fast_fail,
+        min_face_size=min_face_size,
+        max_dimension=max_dimension
+    )
+
+
+def _warm_up() -> None:
+    """
+    Run the detection and blur paths once on a tiny blank image.
+    
+    The first call into the cascade, OpenCV's dispatched kernels, its
+    worker threads and (when installed) the numba kernels is much slower
+    than steady state. Paying that cost at import means the first real
+    request sees steady-state latency. Failures are ignored; the same
+    work is simply done lazily on the first real call instead.
+    
+    This runs on whichever thread imports the module (under Streamlit, a
+    script thread rather than the main thread). That is safe because the
+    numba kernels are serial and never start a numba threading layer,
+    which could otherwise keep the process from exiting.
+    """
+    blank = np.zeros((64, 64, 3), dtype=np.uint8)
+    try:
+        gray = cv2.cvtColor(blank, cv2.COLOR_BGR2GRAY)
+        detect_faces(blank, gray=gray)
+        is_blurry(blank)
+        is_blurry(blank, gray=gray)
+    except Exception:
+        pass
+
+
+_warm_up()
@@ -8,8 +8,13 @@ and run this script to validate it.
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import image_validation
 from image_validation import validate_image, detect_faces, is_blurry
 import cv2
+import numpy as np
 
 
 def main():
@@ -36,7 +41,10 @@ def main():
     print(f"\nValidation Result: {'✓ VALID' if result['valid'] else '✗ INVALID'}")
     print(f"Image dimensions: {result['width']}x{result['height']} pixels")
     print(f"Faces detected: {result['num_faces']}")
-    print(f"Blur score: {result['blur_score']:.2f}")
+    if result['blur_score'] is not None:
+        print(f"Blur score: {result['blur_score']:.2f}")
+    else:
+        print("Blur score: not computed (image already failed validation)")
     
     if not result['valid']:
         print("\nValidation failed for the following reasons:")
@@ -56,7 +64,7 @@ def main():
             print("\nFace Detection:")
             print("-" * 60)
             faces = detect_faces(img)
-            if faces:
+            if len(faces):
                 print(f"Found {len(faces)} face(s):")
                 for i, (x, y, w, h) in enumerate(faces, 1):
                     print(f"  Face {i}: position=({x}, {y}), size={w}x{h}")
@@ -80,5 +88,107 @@ def main():
     print()
 
 
+# Sample images used by the tests, independent of the working directory
+SAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Shapes exercising every border case of the numba kernels' reflection
+KERNEL_TEST_SHAPES = [(1, 1), (1, 7), (7, 1), (2, 2), (3, 5), (64, 48)]
+
+
+def _numba_kernels():
+    """Return the image_validation module, skipping the test without numba."""
+    import pytest
+    if not image_validation.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    return image_validation
+
+
+def _reference_variance(gray):
+    """Variance of OpenCV's Laplacian, the value the kernels must match."""
+    return cv2.Laplacian(gray, cv2.CV_64F).var()
+
+
+def test_gray_kernel_matches_opencv():
+    iv = _numba_kernels()
+    rng = np.random.default_rng(0)
+    for shape in KERNEL_TEST_SHAPES:
+        gray = rng.integers(0, 256, shape, dtype=np.uint8)
+        expected = _reference_variance(gray)
+        actual = iv._laplacian_variance_gray(gray)
+        assert np.isclose(actual, expected, rtol=1e-9, atol=1e-9), shape
+
+
+def test_color_kernel_matches_opencv():
+    iv = _numba_kernels()
+    rng = np.random.default_rng(1)
+    conversions = [(cv2.COLOR_BGR2GRAY, iv._LUMA_B, iv._LUMA_R),
+                   (cv2.COLOR_RGB2GRAY, iv._LUMA_R, iv._LUMA_B)]
+    for shape in KERNEL_TEST_SHAPES:
+        image = rng.integers(0, 256, shape + (3,), dtype=np.uint8)
+        for code, w0, w2 in conversions:
+            expected = _reference_variance(cv2.cvtColor(image, code))
+            actual = iv._laplacian_variance_color(image, w0, w2)
+            assert np.isclose(actual, expected, rtol=1e-9, atol=1e-9), shape
+
+
+def test_color_kernel_luma_matches_cvtcolor():
+    iv = _numba_kernels()
+    # Every 8-bit BGR color once, as a 4096x4096 image
+    values = np.arange(256, dtype=np.uint8)
+    image = np.stack(np.meshgrid(values, values, values, indexing='ij'),
+                     axis=-1).reshape(4096, 4096, 3)
+    expected = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    actual = np.empty(expected.shape, np.int32)
+    for y in range(image.shape[0]):
+        iv._luma_row(image[y].reshape(-1), actual[y], iv._LUMA_B, iv._LUMA_R)
+    assert np.array_equal(actual, expected)
+
+
+def test_blur_score_same_on_every_path():
+    for name in ['image.png', 'input2.png']:
+        image = cv2.imread(os.path.join(SAMPLE_DIR, name))
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        expected = is_blurry(image, gray=gray)[1]
+        scores = [
+            is_blurry(image)[1],
+            image_validation.is_blurry_batch([image])[0][1],
+            image_validation.validate_image_array(
+                image, fast_fail=False)['blur_score'],
+        ]
+        assert np.allclose(scores, expected, rtol=1e-6), name
+
+
+def test_is_blurry_concurrent_calls():
+    image = cv2.imread(os.path.join(SAMPLE_DIR, 'image.png'))
+    expected = is_blurry(image)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: is_blurry(image), range(32)))
+    assert all(result == expected for result in results)
+
+
+def test_invalid_channels_rejected_on_every_path():
+    import pytest
+    image = cv2.imread(os.path.join(SAMPLE_DIR, 'image.png'))
+    calls = [
+        lambda: is_blurry(image, channels='rgb'),
+        lambda: is_blurry(image, channels='rgb', downsample=True),
+        lambda: image_validation.is_blurry_batch([image], channels='rgb'),
+        lambda: detect_faces(image, channels='rgb'),
+        lambda: image_validation.validate_image_array(image, channels='rgb'),
+    ]
+    for call in calls:
+        with pytest.raises(ValueError, match="'BGR', 'RGB'"):
+            call()
+
+
+
+def test_large_image_downscaled_for_detection():
+    image = cv2.imread(os.path.join(SAMPLE_DIR, 'input1.png'))
+    scale, _ = image_validation._detection_scale(
+        image.shape, image_validation.MAX_DETECTION_DIMENSION, None)
+    assert scale < 1.0
+    assert len(detect_faces(image)) == 1
+
+
 if __name__ == '__main__':
     main()